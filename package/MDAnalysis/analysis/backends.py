@@ -16,7 +16,7 @@ subclasses.
 Backends
 --------
 
-Three built-in backend classes are provided:
+Four built-in backend classes are provided:
 
 * *serial*: :class:`BackendSerial`, that is equivalent to using no
   parallelization and is the default
@@ -25,6 +25,10 @@ Three built-in backend classes are provided:
   parallelization via standard Python :mod:`multiprocessing` module
   and uses default :mod:`pickle` serialization
 
+* *threading*: :class:`BackendThreading` that runs the tasks in a pool
+  of threads within the current process; useful when the analysis
+  kernel releases the GIL (IO-bound or numpy/C-heavy work)
+
 * *dask*: :class:`BackendDask`, that uses the same process-based
   parallelization as :class:`BackendMultiprocessing`, but different
   serialization algorithm via `dask <https://dask.org/>`_ (see `dask
@@ -35,11 +39,33 @@ Classes
 -------
 
 """
+import pickle
 import warnings
+from multiprocessing import Pool
+from multiprocessing.pool import ThreadPool
 from typing import Callable
 from MDAnalysis.lib.util import is_installed
 
 
+def _indexed_call(task):
+    """Evaluate an ``(index, func, argument)`` triple and return
+    ``(index, func(argument))``, so that results arriving out of order can be
+    put back into place. Used by :meth:`BackendMultiprocessing.apply`; has to
+    live at module level to be picklable."""
+    idx, func, argument = task
+    return idx, func(argument)
+
+
+def _unpickle_and_call(pickled_func, argument):
+    """Unpickle ``pickled_func`` and evaluate it on ``argument``.
+
+    The round-trip gives the task its own copy of any state bound into the
+    callable (e.g. the analysis instance behind a bound method). Used by the
+    thread-based execution paths, where concurrent tasks would otherwise
+    mutate -- and all return -- one shared object."""
+    return pickle.loads(pickled_func)(argument)
+
+
 class BackendBase:
     """Base class for backend implementation.
 
@@ -217,6 +243,13 @@ class BackendMultiprocessing(BackendBase):
         <multiprocessing.pool.Pool>` to distribute the workload
         between. Must be a positive integer.
 
+    The worker pool is created lazily on the first :meth:`apply` call and
+    kept alive afterwards, so passing the same backend instance to several
+    :meth:`AnalysisBase.run() <MDAnalysis.analysis.base.AnalysisBase.run>`
+    calls re-uses the worker processes instead of forking a fresh pool
+    every time. Use :meth:`close` to shut the workers down explicitly;
+    they are also stopped when the backend instance is garbage collected.
+
     Examples
     --------
 
@@ -232,8 +265,27 @@ class BackendMultiprocessing(BackendBase):
 
     """
 
+    def __init__(self, n_workers: int):
+        # set before validation so __del__ works if validation fails
+        self._pool = None
+        super().__init__(n_workers)
+
+    def close(self):
+        """Terminate the worker pool, if one has been started"""
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool = None
+
+    def __del__(self):
+        self.close()
+
     def apply(self, func: Callable, computations: list) -> list:
-        """Applies `func` to each object in ``computations`` using `multiprocessing`'s `Pool.map`.
+        """Applies `func` to each object in ``computations`` using
+        `multiprocessing`'s `Pool.imap_unordered`.
+
+        Tasks are handed out in batches and collected as soon as any worker
+        finishes, which avoids the head-of-line blocking of ``Pool.map``;
+        the results list is put back into the order of ``computations``.
 
         Parameters
         ----------
@@ -247,10 +299,78 @@ class BackendMultiprocessing(BackendBase):
         list
             list of results of the function
         """
-        from multiprocessing import Pool
+        if self._pool is None:
+            self._pool = Pool(processes=self.n_workers)
+
+        n_tasks = len(computations)
+        results = [None] * n_tasks
+        # a few batches per worker balance scheduling against IPC overhead
+        chunksize = max(1, n_tasks // (4 * self.n_workers))
+        tasks = ((idx, func, task) for idx, task in enumerate(computations))
+        for idx, result in self._pool.imap_unordered(_indexed_call, tasks,
+                                                     chunksize=chunksize):
+            results[idx] = result
+        return results
+
+
+class BackendThreading(BackendBase):
+    """A built-in backend that executes a given function in a pool of threads
+    within the current process, using :class:`multiprocessing.pool.ThreadPool`.
+
+    Since all threads share the interpreter, this backend only speeds up
+    analyses whose per-frame work spends its time outside the GIL --
+    reading frames from disk, or in numpy/C routines that release the
+    lock. For pure-Python per-frame work use
+    :class:`BackendMultiprocessing` instead. The function is round-tripped
+    through :mod:`pickle` so that every task operates on its own copy of
+    any state bound into it, mirroring the isolation the process-based
+    backends get from serialization; task arguments and results are
+    passed along without serialization.
+
+    Parameters
+    ----------
+    n_workers : int
+        number of threads in the pool to distribute the workload between.
+        Must be a positive integer.
+
+    Examples
+    --------
+
+    .. code-block:: python
+
+        from MDAnalysis.analysis.backends import BackendThreading
+
+        backend_obj = BackendThreading(n_workers=4)
+
+
+    .. versionadded:: 2.8.0
+
+    """
+
+    def apply(self, func: Callable, computations: list) -> list:
+        """Applies `func` to each object in ``computations`` using a thread pool.
+
+        The callable is pickled once and unpickled per task, so that
+        concurrent tasks do not share (and race on) the object a bound
+        method belongs to.
+
+        Parameters
+        ----------
+        func : Callable
+            function to be called on each of the tasks in computations list
+        computations : list
+            computation tasks to apply function to
 
-        with Pool(processes=self.n_workers) as pool:
-            results = pool.map(func, computations)
+        Returns
+        -------
+        list
+            list of results of the function
+        """
+        pickled_func = pickle.dumps(func)
+        with ThreadPool(processes=self.n_workers) as pool:
+            results = pool.starmap(
+                _unpickle_and_call,
+                ((pickled_func, task) for task in computations))
         return results
 
 
@@ -261,7 +381,11 @@ class BackendDask(BackendBase):
     :class:`dask.delayed.Delayed` object (created with
     :func:`dask.delayed.delayed`) with ``scheduler='processes'`` and
     ``chunksize=1`` (this ensures uniform distribution of tasks among
-    processes). Requires the `dask package <https://docs.dask.org/en/stable/>`_
+    processes). If a `dask.distributed
+    <https://distributed.dask.org/en/latest/>`_ client is active, its
+    workers are re-used via futures instead of creating a fresh process
+    pool for every :meth:`apply` call. Requires the `dask package
+    <https://docs.dask.org/en/stable/>`_
     to be `installed <https://docs.dask.org/en/stable/install.html>`_.
 
     Parameters
@@ -272,6 +396,17 @@ class BackendDask(BackendBase):
         :class:`multiprocessing.pool.Pool` processes, but they use a different and
         more flexible `serialization protocol
         <https://docs.dask.org/en/stable/phases-of-computation.html#graph-serialization>`_.
+    scheduler : str, optional
+        dask scheduler to use: ``"processes"`` (default) or ``"threads"``.
+        The threaded scheduler skips inter-process transfer of the task
+        results and is useful when the analysis kernel releases the GIL
+        (IO-bound or numpy/C-heavy work), similar to
+        :class:`BackendThreading`; like there, the callable itself is
+        still copied per task (via :mod:`pickle`) so that concurrent
+        tasks do not share state. An active ``dask.distributed`` client
+        takes precedence over this setting.
+
+        .. versionadded:: 2.8.0
 
     Examples
     --------
@@ -288,6 +423,10 @@ class BackendDask(BackendBase):
 
     """
 
+    def __init__(self, n_workers: int, scheduler: str = "processes"):
+        self.scheduler = scheduler
+        super().__init__(n_workers)
+
     def apply(self, func: Callable, computations: list) -> list:
         """Applies `func` to each object in ``computations``.
 
@@ -306,9 +445,30 @@ class BackendDask(BackendBase):
         from dask.delayed import delayed
         import dask
 
-        computations = [delayed(func)(task) for task in computations]
+        # re-use an already running dask.distributed cluster if the user
+        # has one: submitting futures to its workers avoids spinning up
+        # (and tearing down) a process pool for every apply() call
+        try:
+            from distributed import default_client
+            client = default_client()
+        except (ImportError, ValueError):
+            client = None
+
+        if client is not None:
+            futures = client.map(func, computations, pure=False)
+            return client.gather(futures)
+
+        if self.scheduler == "threads":
+            # the threaded scheduler runs the delayed calls in-process
+            # without dask's serialization step, so give each task its own
+            # copy of the state bound into func (see BackendThreading.apply)
+            pickled_func = pickle.dumps(func)
+            computations = [delayed(_unpickle_and_call)(pickled_func, task)
+                            for task in computations]
+        else:
+            computations = [delayed(func)(task) for task in computations]
         results = dask.compute(computations,
-                               scheduler="processes",
+                               scheduler=self.scheduler,
                                chunksize=1,
                                num_workers=self.n_workers)[0]
         return results
@@ -316,7 +476,8 @@ class BackendDask(BackendBase):
     def _get_checks(self):
         """Get dictionary with ``condition: error_message`` pairs that ensure the
         validity of the backend instance. Here checks if ``dask`` module is
-        installed in the environment.
+        installed in the environment and that a known scheduler was
+        requested.
 
         Returns
         -------
@@ -328,6 +489,9 @@ class BackendDask(BackendBase):
         checks = {
             is_installed("dask"):
             ("module 'dask' is missing. Please install 'dask': "
-             "https://docs.dask.org/en/stable/install.html")
+             "https://docs.dask.org/en/stable/install.html"),
+            self.scheduler in ("processes", "threads"):
+            ("scheduler should be 'processes' or 'threads', "
+             f"got {self.scheduler=}"),
         }
         return base_checks | checks
@@ -159,11 +159,21 @@ from .. import coordinates
 from ..core.groups import AtomGroup
 from ..lib.log import ProgressBar
 
-from .backends import BackendDask, BackendMultiprocessing, BackendSerial, BackendBase
+from .backends import (BackendDask, BackendMultiprocessing, BackendSerial,
+                       BackendThreading, BackendBase)
 from .results import Results, ResultsGroup
 
 logger = logging.getLogger(__name__)
 
+#: mapping of the builtin backend names accepted by ``run(backend=...)``
+#: to their classes; built once instead of on every run() call
+_BUILTIN_BACKENDS = {
+    "serial": BackendSerial,
+    "multiprocessing": BackendMultiprocessing,
+    "threading": BackendThreading,
+    "dask": BackendDask,
+}
+
 
 class AnalysisBase(object):
     r"""Base class for defining multi-frame analysis
@@ -257,7 +267,7 @@ class AnalysisBase(object):
 
     .. versionchanged:: 2.8.0
         Added ability to run analysis in parallel using either a
-        built-in backend (`multiprocessing` or `dask`) or a custom
+        built-in backend (`multiprocessing`, `threading` or `dask`) or a custom
         `backends.BackendBase` instance with an implemented `apply` method
         that is used to run the computations.
     """
@@ -271,6 +281,9 @@ class AnalysisBase(object):
 
          - 'serial': no parallelization
          - 'multiprocessing': parallelization using `multiprocessing.Pool`
+         - 'threading': parallelization using a pool of threads within the
+           current process; only faster when the analysis kernel releases
+           the GIL
          - 'dask': parallelization using `dask.delayed.compute()`. Requires
            installation of `mdanalysis[dask]`
 
@@ -595,7 +608,7 @@ class AnalysisBase(object):
         backend : Union[str, BackendBase]
             backend to be used:
                - ``str`` is matched to a builtin backend (one of "serial",
-                 "multiprocessing" and "dask")
+                 "multiprocessing", "threading" and "dask")
                - ``BackendBase`` subclass is checked for the presence of
                  an :meth:`apply` method
         n_workers : int
@@ -630,11 +643,7 @@ class AnalysisBase(object):
 
         .. versionadded:: 2.8.0
         """
-        builtin_backends = {
-            "serial": BackendSerial,
-            "multiprocessing": BackendMultiprocessing,
-            "dask": BackendDask
-        }
+        builtin_backends = _BUILTIN_BACKENDS
 
         backend_class = builtin_backends.get(backend, backend)
         supported_backend_classes = [
@@ -728,9 +737,9 @@ class AnalysisBase(object):
         backend : Union[str, BackendBase], optional
             By default, performs calculations in a serial fashion.
             Otherwise, user can choose a backend: ``str`` is matched to a
-            builtin backend (one of ``serial``, ``multiprocessing`` and
-            ``dask``), or a :class:`MDAnalysis.analysis.results.BackendBase`
-            subclass.
+            builtin backend (one of ``serial``, ``multiprocessing``,
+            ``threading`` and ``dask``), or a
+            :class:`MDAnalysis.analysis.results.BackendBase` subclass.
 
             .. versionadded:: 2.8.0
         n_workers : int
@@ -891,15 +900,15 @@ class AnalysisFromFunction(AnalysisBase):
         Former :attr:`results` are now stored as :attr:`results.timeseries`
 
     .. versionchanged:: 2.8.0
-        Added :meth:`get_supported_backends()`, introducing 'serial', 'multiprocessing'
-        and 'dask' backends.
+        Added :meth:`get_supported_backends()`, introducing 'serial',
+        'multiprocessing', 'threading' and 'dask' backends.
     """
 
     _analysis_algorithm_is_parallelizable = True
 
     @classmethod
     def get_supported_backends(cls):
-        return ("serial", "multiprocessing", "dask")
+        return ("serial", "multiprocessing", "threading", "dask")
 
     def __init__(self, function, trajectory=None, *args, **kwargs):
         if (trajectory is not None) and (not isinstance(
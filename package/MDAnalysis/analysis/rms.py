@@ -360,13 +360,13 @@ class RMSD(AnalysisBase):
        :class:`MDAnalysis.analysis.base.Results` instance.
     .. versionchanged:: 2.8.0
        introduced a :meth:`get_supported_backends` allowing for execution on with
-       ``multiprocessing`` and ``dask`` backends.
+       ``multiprocessing``, ``threading`` and ``dask`` backends.
     """
     _analysis_algorithm_is_parallelizable = True
 
     @classmethod
     def get_supported_backends(cls):
-        return ('serial', 'multiprocessing', 'dask',)
+        return ('serial', 'multiprocessing', 'threading', 'dask',)
 
 
     def __init__(self, atomgroup, reference=None, select='all',
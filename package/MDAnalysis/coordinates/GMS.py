@@ -41,10 +41,22 @@ import os
 import errno
 import re
 
+import numpy as np
+
 from . import base
 import MDAnalysis.lib.util as util
 from MDAnalysis.lib.util import store_init_arguments
 
+# markers that start a coordinate block, compiled once instead of
+# re-matching the pattern strings for every line of the output file
+_NSERCH = re.compile(r'^.NSERCH=.*')
+_COORDS_OPT = re.compile(r'^ COORDINATES OF ALL ATOMS ARE ')
+_BLOCK_RULE = re.compile(r'^\s*-+\s*')
+_COORD1 = re.compile(r'^.COORD 1=\s*([-]?[0-9]+\.[0-9]+).*')
+_ENERGY = re.compile(r'^\s*HAS ENERGY VALUE\s*([-]?[0-9]+\.[0-9]+)\s*')
+_NSERCH_B = re.compile(b'^.NSERCH=.*')
+_COORD1_B = re.compile(b'^.COORD 1=.*')
+
 
 class GMSReader(base.ReaderBase):
     """Reads from an GAMESS output file
@@ -162,16 +174,16 @@ class GMSReader(base.ReaderBase):
 
     def _read_out_n_frames(self):
         if self.runtyp == 'optimize':
-            trigger = re.compile(b'^.NSERCH=.*')
+            trigger = _NSERCH_B
         elif self.runtyp == 'surface':
-            trigger = re.compile(b'^.COORD 1=.*')
+            trigger = _COORD1_B
 
         self._offsets = offsets = []
         with util.openany(self.filename, 'rb') as out:
             line = True
             while not line == b'':  # while not EOF
                 line = out.readline()
-                if re.match(trigger, line):
+                if trigger.match(line):
                     offsets.append(out.tell() - len(line))
 
         return len(offsets)
@@ -188,54 +200,37 @@ class GMSReader(base.ReaderBase):
         # check that the outfile object exists; if not reopen the trajectory
         if self.outfile is None:
             self.open_trajectory()
-        x = []
-        y = []
-        z = []
+        # preallocate the coordinate array instead of growing x/y/z lists
+        # one float at a time
+        positions = np.empty((self.n_atoms, 3), dtype=np.float32)
+
+        # select the block triggers and coordinate columns for this run type
+        # once, instead of dispatching on self.runtyp again for every line
+        if self.runtyp == 'optimize':
+            triggers = (_NSERCH, _COORDS_OPT, _BLOCK_RULE)
+            cols = slice(2, 5)
+        elif self.runtyp == 'surface':
+            triggers = (_COORD1, _ENERGY)
+            cols = slice(1, 4)
 
         flag = 0
         counter = 0
 
         for line in self.outfile:
-            if self.runtyp == 'optimize':
-                if (flag == 0) and (re.match(r'^.NSERCH=.*', line) is not None):
-                    flag = 1
-                    continue
-                if (flag == 1) and (re.match(r'^ COORDINATES OF ALL ATOMS ARE ',\
-                    line) is not None):
-                    flag = 2
-                    continue
-                if (flag == 2) and (re.match(r'^\s*-+\s*', line) is not None):
-                    flag = 3
-                    continue
-                if flag == 3 and counter < self.n_atoms:
-                    words = line.split()
-                    x.append(float(words[2]))
-                    y.append(float(words[3]))
-                    z.append(float(words[4]))
-                    counter += 1
-
-            elif self.runtyp == 'surface':
-                if (flag == 0) and (re.match(\
-                        r'^.COORD 1=\s*([-]?[0-9]+\.[0-9]+).*', line) is not None):
-                    flag = 1
-                    continue
-                if (flag == 1) and (re.match(\
-                        r'^\s*HAS ENERGY VALUE\s*([-]?[0-9]+\.[0-9]+)\s*', line) is not None):
-                    flag = 3
-                    continue
-                if flag == 3 and counter < self.n_atoms:
-                    words = line.split()
-                    x.append(float(words[1]))
-                    y.append(float(words[2]))
-                    z.append(float(words[3]))
-                    counter += 1
+            if flag < len(triggers):
+                if triggers[flag].match(line) is not None:
+                    flag += 1
+                continue
+
+            if counter < self.n_atoms:
+                # one fused str->float cast of the coordinate columns
+                # instead of three Python-level float() calls
+                positions[counter] = line.split()[cols]
+                counter += 1
 
             # stop when the cursor has reached the end of that block
             if counter == self._n_atoms:
-                ts._x[:] = x # more efficient to do it this way to avoid re-creating the numpy arrays
-                ts._y[:] = y
-                ts._z[:] = z
-                #print ts.frame
+                ts.positions = positions
                 ts.frame += 1
                 return ts
 
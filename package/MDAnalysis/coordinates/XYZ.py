@@ -81,7 +81,6 @@ Classes
 -------
 
 """
-import itertools
 import os
 import errno
 import numpy as np
@@ -139,6 +138,8 @@ class XYZWriter(base.WriterBase):
     multiframe = True
     # these are assumed!
     units = {'time': 'ps', 'length': 'Angstrom'}
+    #: printf-style format of an atom line, precomputed once for all frames
+    fmt = "%8s  %10.5f %10.5f %10.5f"
 
     def __init__(self, filename, n_atoms=None, convert_units=True,
                  remark=None, **kwargs):
@@ -176,6 +177,13 @@ class XYZWriter(base.WriterBase):
         self.n_atoms = n_atoms
         self.convert_units = convert_units
 
+        # cache for the Timestep copy used when writing a selection
+        self._ts_slice = None
+        self._ts_slice_indices = None
+
+        # reusable buffer for the formatted coordinate block
+        self._out_buf = None
+
         # can also be gz, bz2
         self._xyz = util.anyopen(self.filename, 'wt')
 
@@ -191,7 +199,26 @@ class XYZWriter(base.WriterBase):
                         "elements or names attributes, writer will default "
                         "atom names to 'X'")
                 warnings.warn(wmsg)
-                return itertools.cycle(('X',))
+                return np.full(atoms.atoms.n_atoms, 'X', dtype='<U1')
+
+    def _get_sliced_ts(self, ts_full, indices):
+        """Return a Timestep restricted to `indices` of `ts_full`.
+
+        The full :meth:`Timestep.copy_slice` is only done when the selection
+        changed since the previous write; otherwise the cached copy is
+        refreshed with the current coordinates by fancy indexing, which is
+        considerably cheaper when writing a selection frame by frame.
+        """
+        ts = self._ts_slice
+        if ts is None or not np.array_equal(indices,
+                                            self._ts_slice_indices):
+            ts = self._ts_slice = ts_full.copy_slice(indices)
+            self._ts_slice_indices = np.asarray(indices).copy()
+        else:
+            # only refresh what _write_next_frame actually consumes
+            ts.positions = ts_full.positions[indices]
+            ts.frame = ts_full.frame
+        return ts
 
     def close(self):
         """Close the trajectory file and finalize the writing"""
@@ -235,7 +262,7 @@ class XYZWriter(base.WriterBase):
                     ts = ts_full
                 else:
                     # Only populate a time step with the selected atoms.
-                    ts = ts_full.copy_slice(atoms.indices)
+                    ts = self._get_sliced_ts(ts_full, atoms.indices)
             elif hasattr(obj, 'trajectory'):
                 # For Universe only --- get everything
                 ts = obj.trajectory.ts
@@ -268,8 +295,7 @@ class XYZWriter(base.WriterBase):
                                  'different number ({}) then expected ({})'
                                  ''.format(ts.n_atoms, self.n_atoms))
         else:
-            if (not isinstance(self.atomnames, itertools.cycle) and
-                len(self.atomnames) != ts.n_atoms):
+            if len(self.atomnames) != ts.n_atoms:
                 logger.info('Trying to write a TimeStep with unknown atoms. '
                             'Expected {} atoms, got {}. Try using "write" if you are '
                             'using "_write_next_frame" directly'.format(
@@ -294,10 +320,14 @@ class XYZWriter(base.WriterBase):
         else:
             self._xyz.write(self.remark.strip() + "\n")
 
-        # Write content
-        for atom, (x, y, z) in zip(self.atomnames, coordinates):
-            self._xyz.write("{0!s:>8}  {1:10.5f} {2:10.5f} {3:10.5f}\n"
-                            "".format(atom, x, y, z))
+        # Write content; hand the whole block to np.savetxt instead of
+        # formatting every line with str.format
+        out = self._out_buf
+        if out is None or len(out) != ts.n_atoms:
+            out = self._out_buf = np.empty((ts.n_atoms, 4), dtype=object)
+        out[:, 0] = self.atomnames
+        out[:, 1:] = coordinates
+        np.savetxt(self._xyz, out, fmt=self.fmt)
 
 
 class XYZReader(base.ReaderBase):
@@ -324,6 +354,9 @@ class XYZReader(base.ReaderBase):
     .. versionchanged:: 0.11.0
        Frames now 0-based instead of 1-based. Added *dt* and
        *time_offset* keywords (passed to :class:`Timestep`)
+    .. versionchanged:: 2.8.0
+       Coordinate blocks are now converted with :func:`numpy.loadtxt`
+       instead of splitting and converting every line in Python.
     """
 
     # Phil Fowler:
@@ -378,18 +411,53 @@ class XYZReader(base.ReaderBase):
         # number of atoms
         linesPerFrame = self.n_atoms + 2
         counter = 0
-        offsets = []
 
-        with util.anyopen(self.filename) as f:
-            line = True
-            while line:
-                if not counter % linesPerFrame:
-                    offsets.append(f.tell())
-                line = f.readline()
-                counter += 1
+        if util.isstream(self.filename):
+            # streams ignore the binary reopen below and only their own
+            # tell() cookies are safe seek() targets, so fall back to
+            # counting lines one at a time
+            offsets = []
+            with util.anyopen(self.filename) as f:
+                line = True
+                while line:
+                    if not counter % linesPerFrame:
+                        offsets.append(f.tell())
+                    line = f.readline()
+                    counter += 1
+            self._offsets = offsets
+            return int(counter / linesPerFrame)
+
+        offsets = [0]
+        lines_left = linesPerFrame
+        bufsize = 1024 * 1024
+        last = b'\n'
+
+        # scan the file in large binary chunks and locate the newlines in C
+        # instead of calling readline()/tell() once per line; the byte
+        # offsets are valid targets for seek() on the text-mode handle
+        # (same approach as GMSReader._read_out_n_frames)
+        with util.anyopen(self.filename, 'rb') as f:
+            offset = 0
+            chunk = f.read(bufsize)
+            while chunk:
+                pos = chunk.find(b'\n')
+                while pos != -1:
+                    counter += 1
+                    lines_left -= 1
+                    if not lines_left:
+                        offsets.append(offset + pos + 1)
+                        lines_left = linesPerFrame
+                    pos = chunk.find(b'\n', pos + 1)
+                offset += len(chunk)
+                last = chunk[-1:]
+                chunk = f.read(bufsize)
+
+        # a trailing line without a final newline still counts as a line
+        if last != b'\n':
+            counter += 1
 
         # need to check this is an integer!
-        n_frames = int(counter / linesPerFrame)
+        n_frames = counter // linesPerFrame
         self._offsets = offsets
         return n_frames
 
@@ -409,11 +477,16 @@ class XYZReader(base.ReaderBase):
             # we assume that there are only two header lines per frame
             f.readline()
             f.readline()
-            # convert all entries at the end once for optimal speed
-            tmp_buf = []
-            for i in range(self.n_atoms):
-                tmp_buf.append(f.readline().split()[1:4])
-            ts.positions = tmp_buf
+            # gather the whole coordinate block and let numpy convert the
+            # three coordinate columns in one vectorized pass instead of
+            # splitting and converting each line in Python
+            lines = [f.readline() for i in range(self.n_atoms)]
+            if lines and not lines[-1]:
+                # hit the end of the file before the frame was complete
+                raise EOFError
+            ts.positions = np.loadtxt(lines, dtype=np.float32,
+                                      usecols=(1, 2, 3), comments=None,
+                                      ndmin=2)
             ts.frame += 1
             return ts
         except (ValueError, IndexError) as err:
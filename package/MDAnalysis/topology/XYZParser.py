@@ -38,6 +38,8 @@ Classes
    :members:
 
 """
+from itertools import islice
+
 import numpy as np
 
 from . import guessers
@@ -84,12 +86,14 @@ class XYZParser(TopologyReaderBase):
             natoms = int(inf.readline().strip())
             inf.readline()
 
-            names = np.zeros(natoms, dtype=object)
-
-            # Can't infinitely read as XYZ files can be multiframe
-            for i in range(natoms):
-                name = inf.readline().split()[0]
-                names[i] = name
+            # Can't infinitely read as XYZ files can be multiframe;
+            # stream exactly the first frame's block into numpy instead
+            # of materializing it with per-line readline() calls. The
+            # names stay in the compact fixed-width unicode dtype that
+            # np.loadtxt produces; the string topology attributes
+            # convert to their own dtype on construction anyway.
+            names = np.loadtxt(islice(inf, natoms), dtype=str, usecols=0,
+                               comments=None, ndmin=1)
 
         # Guessing time
         atomtypes = guessers.guess_types(names)
@@ -115,9 +115,15 @@ def guess_masses(atom_types):
     Returns
     -------
     atom_masses : np.ndarray dtype float64
+
+    .. versionchanged:: 2.8.0
+       The mass lookup is done once per unique atom type instead of once
+       per atom.
     """
     validate_atom_types(atom_types)
-    masses = np.array([get_atom_mass(atom_t) for atom_t in atom_types], dtype=np.float64)
+    unique, inverse = np.unique(np.asarray(atom_types), return_inverse=True)
+    masses = np.array([get_atom_mass(atom_t) for atom_t in unique],
+                      dtype=np.float64)[inverse]
     return masses
 
 
@@ -157,8 +163,15 @@ def guess_types(atom_names):
     Returns
     -------
     atom_types : np.ndarray dtype object
+
+    .. versionchanged:: 2.8.0
+       The element is guessed once per unique atom name instead of once
+       per atom.
     """
-    return np.array([guess_atom_element(name) for name in atom_names], dtype=object)
+    unique, inverse = np.unique(np.asarray(atom_names), return_inverse=True)
+    elements = np.array([guess_atom_element(name) for name in unique],
+                        dtype=object)
+    return elements[inverse]
 
 
 def guess_atom_type(atomname):
@@ -203,10 +216,10 @@ def guess_atom_element(atomname):
         return tables.atomelements[atomname.upper()]
     except KeyError:
         # strip symbols
-        no_symbols = re.sub(SYMBOLS, '', atomname)
+        no_symbols = SYMBOLS.sub('', atomname)
 
         # split name by numbers
-        no_numbers = re.split(NUMBERS, no_symbols)
+        no_numbers = NUMBERS.split(no_symbols)
         no_numbers = list(filter(None, no_numbers)) #remove ''
         # if no_numbers is not empty, use the first element of no_numbers
         name = no_numbers[0].upper() if no_numbers else ''
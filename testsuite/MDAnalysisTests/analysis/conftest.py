@@ -64,7 +64,8 @@ def client_AnalysisFromFunction(request):
 
 @pytest.fixture(scope='module',
                 params=params_for_cls(AnalysisFromFunction,
-                                      exclude=['multiprocessing']))
+                                      exclude=['multiprocessing',
+                                               'threading']))
 def client_AnalysisFromFunctionAnalysisClass(request):
     return request.param
 
@@ -23,6 +23,7 @@ class Test_Backends:
             (backends.BackendBase, -1),
             (backends.BackendSerial, None),
             (backends.BackendMultiprocessing, "string"),
+            (backends.BackendThreading, 2.5),
             (backends.BackendDask, ()),
         ],
     )
@@ -42,10 +43,13 @@ class Test_Backends:
     def test_all_backends_give_correct_results(self, func, iterable, answer):
         backend_instances = [
             backends.BackendMultiprocessing(n_workers=2),
+            backends.BackendThreading(n_workers=2),
             backends.BackendSerial(n_workers=1),
         ]
         if is_installed("dask"):
             backend_instances.append(backends.BackendDask(n_workers=2))
+            backend_instances.append(
+                backends.BackendDask(n_workers=2, scheduler="threads"))
 
         backends_dict = {b: b.apply(func, iterable) for b in backend_instances}
         for answ in backends_dict.values():
@@ -70,3 +74,9 @@ class Test_Backends:
     def test_get_errors(self, backend_cls, params, error_message):
         with pytest.raises(ValueError, match=error_message):
             backend_cls(**params)
+
+    @pytest.mark.skipif(not is_installed("dask"),
+                        reason="dask is not installed")
+    def test_dask_unknown_scheduler(self):
+        with pytest.raises(ValueError, match="scheduler should be"):
+            backends.BackendDask(n_workers=2, scheduler="cluster")
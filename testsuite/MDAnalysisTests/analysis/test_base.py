@@ -42,7 +42,7 @@ class FrameAnalysis(base.AnalysisBase):
     """Just grabs frame numbers of frames it goes over"""
 
     @classmethod
-    def get_supported_backends(cls): return ('serial', 'dask', 'multiprocessing')
+    def get_supported_backends(cls): return ('serial', 'dask', 'multiprocessing', 'threading')
 
     _analysis_algorithm_is_parallelizable = True
 
@@ -35,16 +35,20 @@ from MDAnalysis.analysis.dihedrals import Dihedral, Ramachandran, Janin
 
 class TestDihedral(object):
 
-    @pytest.fixture()
+    @pytest.fixture(scope="class")
     def atomgroup(self):
         u = mda.Universe(GRO, XTC)
         ag = u.select_atoms("(resid 4 and name N CA C) or (resid 5 and name N)")
         return ag
 
+    @pytest.fixture(scope="class")
+    def dihedral(self, atomgroup):
+        # shared full-trajectory pass; tests that exercise run() options
+        # (e.g. start/stop) still do their own run
+        return Dihedral([atomgroup]).run()
 
-    def test_dihedral(self, atomgroup):
-        dihedral = Dihedral([atomgroup]).run()
-        test_dihedral = np.load(DihedralArray)
+    def test_dihedral(self, dihedral):
+        test_dihedral = np.load(DihedralArray, mmap_mode="r")
 
         assert_allclose(dihedral.results.angles, test_dihedral, rtol=0, atol=1.5e-5,
                             err_msg="error: dihedral angles should "
@@ -52,7 +56,7 @@ class TestDihedral(object):
 
     def test_dihedral_single_frame(self, atomgroup):
         dihedral = Dihedral([atomgroup]).run(start=5, stop=6)
-        test_dihedral = [np.load(DihedralArray)[5]]
+        test_dihedral = [np.load(DihedralArray, mmap_mode="r")[5]]
 
         assert_allclose(dihedral.results.angles, test_dihedral, rtol=0, atol=1.5e-5,
                             err_msg="error: dihedral angles should "
@@ -60,7 +64,7 @@ class TestDihedral(object):
 
     def test_atomgroup_list(self, atomgroup):
         dihedral = Dihedral([atomgroup, atomgroup]).run()
-        test_dihedral = np.load(DihedralsArray)
+        test_dihedral = np.load(DihedralsArray, mmap_mode="r")
 
         assert_allclose(dihedral.results.angles, test_dihedral, rtol=0, atol=1.5e-5,
                             err_msg="error: dihedral angles should "
@@ -70,9 +74,7 @@ class TestDihedral(object):
         with pytest.raises(ValueError):
             dihedral = Dihedral([atomgroup[:2]]).run()
 
-    def test_dihedral_attr_warning(self, atomgroup):
-        dihedral = Dihedral([atomgroup]).run(stop=2)
-
+    def test_dihedral_attr_warning(self, dihedral):
         wmsg = "The `angle` attribute was deprecated in MDAnalysis 2.0.0"
         with pytest.warns(DeprecationWarning, match=wmsg):
             assert_equal(dihedral.angles, dihedral.results.angles)
@@ -80,13 +82,13 @@ class TestDihedral(object):
 
 class TestRamachandran(object):
 
-    @pytest.fixture()
+    @pytest.fixture(scope="class")
     def universe(self):
         return mda.Universe(GRO, XTC)
 
     @pytest.fixture()
     def rama_ref_array(self):
-        return np.load(RamaArray)
+        return np.load(RamaArray, mmap_mode="r")
 
     def test_ramachandran(self, universe, rama_ref_array):
         rama = Ramachandran(universe.select_atoms("protein")).run()
@@ -105,7 +107,7 @@ class TestRamachandran(object):
 
     def test_ramachandran_residue_selections(self, universe):
         rama = Ramachandran(universe.select_atoms("resname GLY")).run()
-        test_rama = np.load(GLYRamaArray)
+        test_rama = np.load(GLYRamaArray, mmap_mode="r")
 
         assert_allclose(rama.results.angles, test_rama, rtol=0, atol=1.5e-5,
                             err_msg="error: dihedral angles should "
@@ -146,17 +148,17 @@ class TestRamachandran(object):
 
 class TestJanin(object):
 
-    @pytest.fixture()
+    @pytest.fixture(scope="class")
     def universe(self):
         return mda.Universe(GRO, XTC)
 
-    @pytest.fixture()
+    @pytest.fixture(scope="class")
     def universe_tpr(self):
         return mda.Universe(TPR, XTC)
 
     @pytest.fixture()
     def janin_ref_array(self):
-        return np.load(JaninArray)
+        return np.load(JaninArray, mmap_mode="r")
 
     def test_janin(self, universe, janin_ref_array):
         self._test_janin(universe, janin_ref_array)
@@ -182,7 +184,7 @@ class TestJanin(object):
 
     def test_janin_residue_selections(self, universe):
         janin = Janin(universe.select_atoms("resname LYS")).run()
-        test_janin = np.load(LYSJaninArray)
+        test_janin = np.load(LYSJaninArray, mmap_mode="r")
 
         assert_allclose(janin.results.angles, test_janin, rtol=0, atol=1.5e-3,
                             err_msg="error: dihedral angles should "
@@ -446,7 +446,8 @@ def test_not_parallelizable(classname, is_parallelizable):
 @pytest.mark.parametrize(
     "classname,backends",
     [
-        (MDAnalysis.analysis.rms.RMSD,  ('serial', 'multiprocessing', 'dask',)),
+        (MDAnalysis.analysis.rms.RMSD,  ('serial', 'multiprocessing',
+                                         'threading', 'dask',)),
         (MDAnalysis.analysis.rms.RMSF, ('serial',)),
     ]
 )